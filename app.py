@@ -6,6 +6,7 @@ import streamlit as st
 import joblib
 import pandas as pd
 from datetime import datetime
+from explain import DecisionExplainer, format_driver
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -26,6 +27,11 @@ def load_model():
 
 model = load_model()
 
+@st.cache_resource
+def load_explainer(_model):
+    """Build the per-decision explainer once per loaded model."""
+    return DecisionExplainer(_model)
+
 # This dictionary is the "brain" for interpreting the model's output
 ACTION_MAP = {
     0: {"icon": "✅", "message": "System OK. Conditions are optimal.", "color": "green"},
@@ -150,6 +156,10 @@ else:
         """)
         st.subheader("Data Sent to Model (After Preprocessing)")
         st.dataframe(live_data_processed)
+        st.subheader("Top Drivers of This Decision")
+        explanation = load_explainer(model).explain(live_data_processed)
+        for driver in explanation['drivers']:
+            st.markdown(f"- `{format_driver(driver)}` (contribution: {driver['contribution']:+.2f})")
         st.subheader("Raw Prediction Output")
         st.json({
             "predicted_action_code": predicted_action_code,
@@ -1,6 +1,9 @@
 import time
 import joblib # To load the trained model
 import random # To simulate sensor readings for this example
+import pandas as pd # To hand the model rows with the column names it was trained on
+from explain import DecisionExplainer, format_driver
+from drift_monitor import DriftMonitor, load_reference_profile, format_drift_alert
 
 # --- Action Interpretation and Alerting System ---
 # This dictionary maps the model's output (0-4) to concrete actions and messages.
@@ -13,8 +16,35 @@ ACTION_MAP = {
     4: {"sprinkle": "OFF", "message": "ALERT: Soil is wet but lacks nutrients. Fertigation recommended."}
 }
 
+ZONE_ID = "zone-1" # Identifies this controller's garden section in drift alerts
+
 # --- Placeholder Functions for Hardware and Alerts ---
 
+def get_current_season():
+    """Maps the current month to the North East India season used in training (see Dataset.py)."""
+    month = time.localtime().tm_mon
+    if 6 <= month <= 9:
+        return 'Monsoon'
+    elif month in (10, 11):
+        return 'Post-Monsoon'
+    elif month in (12, 1, 2):
+        return 'Winter'
+    else:
+        return 'Pre-Monsoon'
+
+def build_feature_row(current_data, feature_names):
+    """
+    Turns a sensor reading into the model's input row: one-hot season columns
+    followed by the numeric readings, in the exact order used during training.
+    """
+    row = []
+    for name in feature_names:
+        if name.startswith('season_'):
+            row.append(1 if name == f"season_{current_data['season']}" else 0)
+        else:
+            row.append(current_data[name])
+    return pd.DataFrame([row], columns=feature_names)
+
 def get_sensor_data():
     """
     In a real system, this reads from your sensors (MCP3008, DHT22, etc.).
@@ -27,7 +57,8 @@ def get_sensor_data():
         'humidity': random.randint(65, 95),
         'rain_probability': random.uniform(0.0, 1.0),
         'time_of_day': time.localtime().tm_hour,
-        'soil_ec': random.uniform(0.8, 4.0)
+        'soil_ec': random.uniform(0.8, 4.0),
+        'season': get_current_season()
     }
     print(f"\n[Sensor Read] Moisture: {simulated_data['soil_moisture']}, EC: {simulated_data['soil_ec']:.2f}, Rain: {simulated_data['rain_probability']:.2f}")
     return simulated_data
@@ -65,23 +96,30 @@ def main():
         print("Error: 'sprinkler_model.pkl' not found. Please train the model first.")
         return
 
+    explainer = DecisionExplainer(model)
+
+    # Load the training-time input profile so we can tell when sensors drift
+    try:
+        drift_monitor = DriftMonitor(load_reference_profile())
+    except FileNotFoundError:
+        print("Warning: 'drift_reference.json' not found. Input drift monitoring is disabled.")
+        drift_monitor = None
+
     while True:
         # 1. Gather all inputs
         current_data = get_sensor_data()
+
+        # Check the readings still look like the data the model was trained on
+        if drift_monitor is not None:
+            for drift_alert in drift_monitor.update(current_data, zone=ZONE_ID):
+                send_alert_to_device(format_drift_alert(drift_alert), priority="HIGH")
         
         # 2. Format data for the model
         # The order must be EXACTLY the same as during training!
-        features = [
-            current_data['soil_moisture'],
-            current_data['temperature'],
-            current_data['humidity'],
-            current_data['rain_probability'],
-            current_data['time_of_day'],
-            current_data['soil_ec']
-        ]
+        features = build_feature_row(current_data, list(model.feature_names_in_))
         
         # 3. Get a decision from the AI model
-        predicted_action_code = model.predict([features])[0] # model.predict returns a list, e.g., [2]
+        predicted_action_code = model.predict(features)[0] # model.predict returns a list, e.g., [2]
         
         # 4. Interpret and execute the decision
         if predicted_action_code in ACTION_MAP:
@@ -93,6 +131,10 @@ def main():
             # Send status message and alerts
             alert_message = action["message"]
             if "ALERT" in alert_message or "WARNING" in alert_message:
+                # Attach the top drivers so the farmer knows why the alert fired
+                drivers = explainer.explain(features)['drivers']
+                if drivers:
+                    alert_message += " Drivers: " + "; ".join(format_driver(d) for d in drivers)
                 send_alert_to_device(alert_message, priority="HIGH")
             else:
                 send_alert_to_device(alert_message, priority="NORMAL")
@@ -0,0 +1,232 @@
+# =============================================================================
+# DRIFT_MONITOR.PY - Streaming Input-Drift Monitor for the Controller
+#
+# Description:
+# Checks whether live sensor readings still look like the X_train.csv data
+# the model learned from. train_model.py saves a reference profile (fixed
+# histogram bins, proportions, mean and std per feature). At run time the
+# monitor keeps exponentially-weighted running statistics and bin counts per
+# feature and per zone, so memory per zone is constant and each reading
+# costs only a few operations. When the Population Stability Index (PSI)
+# between the live and reference histograms crosses a threshold, a drift
+# alert is raised (e.g. moisture sensors saturating at ADC 950, or EC leaving
+# the 0.7-3.5 range the dataset covers).
+#
+# Weather readings depend heavily on the season, and a live controller only
+# ever sees one season at a time, so those features are compared with the
+# profile of the current season rather than one pooled over the whole year.
+# =============================================================================
+
+import json
+import math
+from bisect import bisect_right
+
+import numpy as np
+
+# --- Configuration ---
+REFERENCE_PROFILE_PATH = 'drift_reference.json'
+# time_of_day is left out on purpose: the controller reads it from the clock,
+# so a few hours of live readings can never match the uniform 0-23 training spread
+POOLED_FEATURES = ['soil_moisture', 'soil_ec']                      # Same spread all year
+SEASONAL_FEATURES = ['temperature', 'humidity', 'rain_probability']  # Profiled per season
+SEASON_PREFIX = 'season_'  # One-hot season columns in X_train.csv, e.g. 'season_Monsoon'
+NUM_BINS = 10            # Quantile bins from training data (plus under/overflow)
+HALF_LIFE = 500          # Readings after which an old reading counts half as much
+MIN_SAMPLES = 200        # Effective sample size needed before PSI noise is small enough to judge
+PSI_THRESHOLD = 0.25     # Common rule of thumb: PSI > 0.25 means significant shift
+PSI_RECOVERY = 0.1       # PSI must fall below this before the same alert can fire again
+PSI_EPSILON = 1e-4       # Floor for empty bins so PSI stays finite
+
+
+def _bin_index(edges, value):
+    """Bin 0 is below the training minimum, bin len(edges) is at/above the maximum."""
+    return bisect_right(edges, value)
+
+
+def _feature_profile(values, num_bins):
+    """Bin edges are quantiles of `values`, so each inner bin holds a similar share."""
+    quantiles = np.quantile(values, np.linspace(0, 1, num_bins + 1))
+    edges = np.unique(quantiles).tolist()
+
+    counts = [0] * (len(edges) + 1)
+    for v in values:
+        counts[_bin_index(edges, v)] += 1
+
+    return {
+        'edges': edges,
+        'proportions': [c / len(values) for c in counts],
+        'mean': float(values.mean()),
+        'std': float(values.std()),
+    }
+
+
+def build_reference_profile(X_train, num_bins=NUM_BINS):
+    """
+    Summarises the training data into a small reference profile: one histogram
+    per pooled feature, plus one per seasonal feature for every season.
+    """
+    profile = {'features': {}, 'seasons': {}}
+    for name in POOLED_FEATURES:
+        if name in X_train.columns:
+            profile['features'][name] = _feature_profile(X_train[name].to_numpy(dtype=float), num_bins)
+
+    for column in X_train.columns:
+        if not column.startswith(SEASON_PREFIX):
+            continue
+        in_season = X_train[X_train[column] == 1]
+        profile['seasons'][column[len(SEASON_PREFIX):]] = {
+            name: _feature_profile(in_season[name].to_numpy(dtype=float), num_bins)
+            for name in SEASONAL_FEATURES if name in X_train.columns
+        }
+    return profile
+
+
+def save_reference_profile(profile, path=REFERENCE_PROFILE_PATH):
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_reference_profile(path=REFERENCE_PROFILE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def population_stability_index(expected, actual):
+    """PSI = sum((a - e) * ln(a / e)) over bins, with empty bins floored."""
+    psi = 0.0
+    for e, a in zip(expected, actual):
+        e = max(e, PSI_EPSILON)
+        a = max(a, PSI_EPSILON)
+        psi += (a - e) * math.log(a / e)
+    return psi
+
+
+class _FeatureStats:
+    """Exponentially-weighted mean, variance and bin counts for one feature in one zone."""
+
+    __slots__ = ('weight', 'mean', 'var', 'counts')
+
+    def __init__(self, num_bins):
+        self.weight = 0.0
+        self.mean = 0.0
+        self.var = 0.0
+        self.counts = [0.0] * num_bins
+
+    def update(self, value, bin_index, decay):
+        self.weight = self.weight * decay + 1.0
+        alpha = 1.0 / self.weight
+        diff = value - self.mean
+        self.mean += alpha * diff
+        self.var = (1.0 - alpha) * (self.var + alpha * diff * diff)
+
+        counts = self.counts
+        for i in range(len(counts)):
+            counts[i] *= decay
+        counts[bin_index] += 1.0
+
+    def proportions(self):
+        return [c / self.weight for c in self.counts]
+
+
+class DriftMonitor:
+    """
+    Tracks live readings per zone and compares them with the training profile.
+
+    Call update() once per sensor read; it returns the drift alerts that were
+    newly raised by that reading (an alert re-arms once the feature recovers
+    below PSI_RECOVERY, so a value hovering at the threshold does not spam).
+    Seasonal features are judged against reading['season']'s profile, and their
+    running statistics start afresh when a zone moves into a new season.
+    """
+
+    def __init__(self, profile, threshold=PSI_THRESHOLD, half_life=HALF_LIFE, min_samples=MIN_SAMPLES):
+        self.pooled_reference = profile['features']
+        self.seasonal_reference = profile.get('seasons', {})
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.decay = 0.5 ** (1.0 / half_life)
+        self._zones = {}
+        self._seasons = {}
+        self._drifting = {}
+
+    def _zone_stats(self, zone, season=None):
+        if zone not in self._zones:
+            self._zones[zone] = {
+                name: _FeatureStats(len(ref['proportions']))
+                for name, ref in self.pooled_reference.items()
+            }
+            self._seasons[zone] = None
+            self._drifting[zone] = set()
+
+        stats = self._zones[zone]
+        if season is not None and season != self._seasons[zone] and season in self.seasonal_reference:
+            # New season: drop the old season's statistics and alerts, keep the pooled ones
+            for name in stats.keys() - self.pooled_reference.keys():
+                del stats[name]
+                self._drifting[zone].discard(name)
+            for name, ref in self.seasonal_reference[season].items():
+                stats[name] = _FeatureStats(len(ref['proportions']))
+            self._seasons[zone] = season
+        return stats
+
+    def _references(self, zone):
+        """The pooled profiles plus the zone's current season profiles, by feature."""
+        references = dict(self.pooled_reference)
+        season = self._seasons.get(zone)
+        if season is not None:
+            references.update(self.seasonal_reference[season])
+        return references
+
+    def update(self, reading, zone="default"):
+        stats = self._zone_stats(zone, reading.get('season'))
+        drifting = self._drifting[zone]
+        alerts = []
+
+        for name, ref in self._references(zone).items():
+            if name not in reading:
+                continue
+            value = float(reading[name])
+            feature_stats = stats[name]
+            feature_stats.update(value, _bin_index(ref['edges'], value), self.decay)
+
+            if feature_stats.weight < self.min_samples:
+                continue
+            psi = population_stability_index(ref['proportions'], feature_stats.proportions())
+
+            if psi > self.threshold and name not in drifting:
+                drifting.add(name)
+                alerts.append({
+                    'zone': zone,
+                    'season': self._seasons[zone],
+                    'feature': name,
+                    'psi': psi,
+                    'live_mean': feature_stats.mean,
+                    'reference_mean': ref['mean'],
+                })
+            elif psi < PSI_RECOVERY:
+                drifting.discard(name)
+        return alerts
+
+    def summary(self, zone="default"):
+        """Current PSI and running mean/std per feature for one zone."""
+        stats = self._zone_stats(zone)
+        report = {}
+        for name, ref in self._references(zone).items():
+            feature_stats = stats[name]
+            report[name] = {
+                'samples': feature_stats.weight,
+                'live_mean': feature_stats.mean,
+                'live_std': math.sqrt(feature_stats.var),
+                'reference_mean': ref['mean'],
+                'reference_std': ref['std'],
+                'psi': population_stability_index(ref['proportions'], feature_stats.proportions())
+                       if feature_stats.weight else 0.0,
+            }
+        return report
+
+
+def format_drift_alert(alert):
+    return (
+        f"INPUT DRIFT in {alert['zone']}: {alert['feature']} no longer matches training data "
+        f"(PSI {alert['psi']:.2f}, live mean {alert['live_mean']:.2f} vs trained {alert['reference_mean']:.2f})."
+    )
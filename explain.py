@@ -0,0 +1,155 @@
+# =============================================================================
+# EXPLAIN.PY - Per-Decision Feature Attribution for the RandomForest
+#
+# Description:
+# Explains a single prediction by walking each tree's decision path once and
+# crediting every split with the change it made to the winning class's
+# probability. Summed across the forest, these contributions show which
+# sensor readings pushed the AI toward its decision, e.g.
+#     "soil_ec 3.1 > 2.8 pushed toward code 2"
+# The cost is bounded by (number of trees x tree depth), and results are
+# cached per input so the controller can attach them to alerts cheaply.
+# =============================================================================
+
+from collections import OrderedDict
+
+import numpy as np
+
+TREE_LEAF = -1      # Marker sklearn uses for "no child" in tree_.children_left
+CACHE_SIZE = 256    # Number of recent inputs whose explanation is remembered
+
+
+class DecisionExplainer:
+    """
+    Explains the RandomForest's vote for one row of features at a time.
+
+    The tree structure is copied out of the model once, so every call only
+    has to walk the nodes on each tree's decision path.
+    """
+
+    def __init__(self, model, feature_names=None, cache_size=CACHE_SIZE):
+        if feature_names is None:
+            feature_names = getattr(model, 'feature_names_in_', None)
+        if feature_names is None:
+            feature_names = [f"feature_{i}" for i in range(model.n_features_in_)]
+        self.feature_names = list(feature_names)
+        self.classes = list(model.classes_)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+        # Plain Python lists are much faster to index node-by-node than numpy arrays
+        self._trees = []
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            value = tree.value[:, 0, :]
+            totals = value.sum(axis=1, keepdims=True)
+            proba = value / np.where(totals == 0, 1, totals)
+            self._trees.append((
+                tree.children_left.tolist(),
+                tree.children_right.tolist(),
+                tree.feature.tolist(),
+                tree.threshold.tolist(),
+                proba.tolist(),
+            ))
+
+    def explain(self, features, top_n=3):
+        """
+        Returns the predicted action code and the top features that drove it.
+
+        `features` may be a list, dict, pandas Series or single-row DataFrame
+        in the same column order the model was trained on.
+        """
+        values = self._to_values(features)
+        key = (values, top_n)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            self._cache[key] = self._explain_row(values, top_n)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        # Hand out a copy so callers can't edit the cached explanation
+        result = self._cache[key]
+        return {**result, 'drivers': [dict(d) for d in result['drivers']]}
+
+    def _to_values(self, features):
+        if hasattr(features, 'iloc') and getattr(features, 'ndim', 1) == 2:
+            features = features.iloc[0]
+        if hasattr(features, 'keys'):
+            features = [features[name] for name in self.feature_names]
+        return tuple(float(x) for x in features)
+
+    def _explain_row(self, values, top_n):
+        # sklearn compares float32 inputs against the split thresholds, so walk the
+        # trees with the same precision but report the caller's original values
+        row = np.asarray(values, dtype=np.float32).tolist()
+
+        # 1. Walk every tree once, remembering the path and averaging the leaves
+        paths = []
+        vote = [0.0] * len(self.classes)
+        for left, right, feature, threshold, proba in self._trees:
+            node = 0
+            path = [node]
+            while left[node] != TREE_LEAF:
+                if row[feature[node]] <= threshold[node]:
+                    node = left[node]
+                else:
+                    node = right[node]
+                path.append(node)
+            paths.append(path)
+            for k, p in enumerate(proba[node]):
+                vote[k] += p
+
+        winner = max(range(len(vote)), key=vote.__getitem__)
+        action_code = self.classes[winner]
+
+        # 2. Credit each split with how much it moved the winning class probability.
+        # The condition shown for a driver is its strongest split *toward* the
+        # winner, so it never describes a split that actually pushed away.
+        contributions = {}
+        strongest_push = {}
+        for (left, _, feature, threshold, proba), path in zip(self._trees, paths):
+            for parent, child in zip(path, path[1:]):
+                f = feature[parent]
+                delta = proba[child][winner] - proba[parent][winner]
+                contributions[f] = contributions.get(f, 0.0) + delta
+                if delta > 0 and (f not in strongest_push or delta > strongest_push[f][0]):
+                    op = "<=" if child == left[parent] else ">"
+                    strongest_push[f] = (delta, op, threshold[parent])
+
+        n_trees = len(self._trees)
+        drivers = []
+        for f, total in contributions.items():
+            if total <= 0:
+                continue
+            _, op, split_threshold = strongest_push[f]
+            drivers.append({
+                'feature': self.feature_names[f],
+                'value': values[f],
+                'op': op,
+                'threshold': split_threshold,
+                'contribution': total / n_trees,
+                'action_code': action_code,
+            })
+        drivers.sort(key=lambda d: d['contribution'], reverse=True)
+
+        return {
+            'action_code': action_code,
+            'confidence': vote[winner] / n_trees,
+            'drivers': drivers[:top_n],
+        }
+
+
+def format_driver(driver):
+    """Turns one driver into a short sentence, e.g. 'soil_ec 3.1 > 2.8 pushed toward code 2'."""
+    value, op, threshold = driver['value'], driver['op'], driver['threshold']
+    # Add decimals until the rounded numbers still show the split that was taken,
+    # so a value of 2.797 against 2.795 never prints as "2.8 > 2.8"
+    for digits in range(2, 7):
+        shown_value, shown_threshold = round(value, digits), round(threshold, digits)
+        if (shown_value > shown_threshold) if op == ">" else (shown_value <= shown_threshold):
+            break
+    return (
+        f"{driver['feature']} {shown_value:g} {op} {shown_threshold:g} "
+        f"pushed toward code {driver['action_code']}"
+    )
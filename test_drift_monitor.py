@@ -0,0 +1,88 @@
+import os
+
+import pandas as pd
+import pytest
+
+from drift_monitor import (
+    DriftMonitor, build_reference_profile, load_reference_profile,
+    PSI_THRESHOLD, REFERENCE_PROFILE_PATH
+)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TICK_SECONDS = 30  # Matches the controller's sleep between sensor reads
+SEASONS = ['Monsoon', 'Post-Monsoon', 'Pre-Monsoon', 'Winter']
+
+
+@pytest.fixture(scope="module")
+def X_train():
+    return pd.read_csv(os.path.join(HERE, 'Dataset', 'X_train.csv'))
+
+
+@pytest.fixture(scope="module")
+def profile():
+    return load_reference_profile(os.path.join(HERE, REFERENCE_PROFILE_PATH))
+
+
+def season_readings(X_train, season, n, random_state, labelled_as=None):
+    """Training rows from one season, shaped like controller readings."""
+    rows = X_train[X_train[f'season_{season}'] == 1]
+    readings = rows.sample(n=n, replace=True, random_state=random_state).to_dict('records')
+    for tick, reading in enumerate(readings):
+        reading['season'] = labelled_as or season
+        reading['time_of_day'] = (tick * TICK_SECONDS // 3600) % 24
+    return readings
+
+
+def test_committed_profile_matches_training_data(X_train, profile):
+    rebuilt = build_reference_profile(X_train)
+    assert rebuilt['seasons'].keys() == profile['seasons'].keys()
+    for rebuilt_group, group in [(rebuilt['features'], profile['features'])] + [
+        (rebuilt['seasons'][season], profile['seasons'][season]) for season in profile['seasons']
+    ]:
+        assert rebuilt_group.keys() == group.keys()
+        for name, reference in group.items():
+            for key, value in reference.items():
+                assert rebuilt_group[name][key] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("season", SEASONS)
+def test_no_alert_on_one_season_with_clock_driven_time(X_train, profile, season):
+    monitor = DriftMonitor(profile)
+    for reading in season_readings(X_train, season, n=2000, random_state=0):
+        assert monitor.update(reading, zone="zone-1") == []
+
+
+def test_no_alert_when_season_changes(X_train, profile):
+    monitor = DriftMonitor(profile)
+    for season in ['Post-Monsoon', 'Winter']:
+        for reading in season_readings(X_train, season, n=1000, random_state=1):
+            assert monitor.update(reading, zone="zone-1") == []
+    winter_temperature = profile['seasons']['Winter']['temperature']['mean']
+    assert monitor.summary("zone-1")['temperature']['reference_mean'] == winter_temperature
+
+
+def test_alert_on_weather_that_does_not_fit_the_season(X_train, profile):
+    monitor = DriftMonitor(profile)
+    alerts = []
+    for reading in season_readings(X_train, 'Winter', n=1000, random_state=2, labelled_as='Monsoon'):
+        alerts += monitor.update(reading, zone="zone-1")
+    assert {'temperature', 'humidity', 'rain_probability'} <= {a['feature'] for a in alerts}
+
+
+def test_alert_on_saturated_soil_moisture(X_train, profile):
+    monitor = DriftMonitor(profile)
+    alerts = []
+    for reading in season_readings(X_train, 'Monsoon', n=1000, random_state=3):
+        reading['soil_moisture'] = 950
+        alerts += monitor.update(reading, zone="zone-1")
+    assert [a['feature'] for a in alerts] == ['soil_moisture']
+
+
+def test_zones_are_tracked_separately(X_train, profile):
+    monitor = DriftMonitor(profile)
+    saturated_alerts = []
+    for reading in season_readings(X_train, 'Monsoon', n=1000, random_state=4):
+        assert monitor.update(reading, zone="healthy") == []
+        saturated_alerts += monitor.update(dict(reading, soil_moisture=950), zone="saturated")
+    assert [a['zone'] for a in saturated_alerts] == ['saturated']
+    assert monitor.summary("healthy")['soil_moisture']['psi'] < PSI_THRESHOLD
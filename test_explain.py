@@ -0,0 +1,91 @@
+import os
+
+import joblib
+import pandas as pd
+import pytest
+
+from controller import build_feature_row
+from explain import DecisionExplainer, format_driver
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module")
+def model():
+    return joblib.load(os.path.join(HERE, 'sprinkler_model.pkl'))
+
+
+@pytest.fixture(scope="module")
+def X_test():
+    return pd.read_csv(os.path.join(HERE, 'Dataset', 'X_test.csv'))
+
+
+def test_matches_predict_proba(model, X_test):
+    explainer = DecisionExplainer(model)
+    rows = X_test.iloc[:200]
+    proba = model.predict_proba(rows)
+    for i in range(len(rows)):
+        result = explainer.explain(rows.iloc[[i]])
+        winner = proba[i].argmax()
+        assert result['action_code'] == model.classes_[winner]
+        assert result['confidence'] == pytest.approx(proba[i][winner])
+
+
+def test_drivers_show_a_split_that_holds_and_pushes_toward_winner(model, X_test):
+    explainer = DecisionExplainer(model)
+    for i in range(100):
+        for driver in explainer.explain(X_test.iloc[[i]])['drivers']:
+            assert driver['contribution'] > 0
+            if driver['op'] == ">":
+                assert driver['value'] > driver['threshold']
+            else:
+                assert driver['value'] <= driver['threshold']
+
+
+def test_repeated_input_is_served_from_cache(model, X_test):
+    explainer = DecisionExplainer(model)
+    row = list(X_test.iloc[0])
+    first = explainer.explain(row)
+    assert len(explainer._cache) == 1
+    assert explainer.explain(list(row)) == first
+    assert len(explainer._cache) == 1
+
+
+def test_editing_a_result_does_not_change_the_cache(model, X_test):
+    explainer = DecisionExplainer(model)
+    row = list(X_test.iloc[0])
+    first = explainer.explain(row)
+    expected = explainer.explain(row)
+    first['drivers'][0]['feature'] = 'edited'
+    first['drivers'].clear()
+    assert explainer.explain(row) == expected
+
+
+def test_drivers_report_the_original_input_values(model):
+    row = [0, 0, 1, 0, 900, 27.3, 70, 0.2, 14, 0.7295]
+    drivers = DecisionExplainer(model).explain(row)['drivers']
+    assert drivers
+    for driver in drivers:
+        assert driver['value'] == row[list(model.feature_names_in_).index(driver['feature'])]
+
+
+def test_format_driver_keeps_comparison_visible():
+    driver = {'feature': 'soil_ec', 'value': 2.7972, 'op': '>', 'threshold': 2.7968, 'action_code': 2}
+    assert format_driver(driver) == "soil_ec 2.7972 > 2.7968 pushed toward code 2"
+
+    driver = {'feature': 'soil_ec', 'value': 3.1, 'op': '>', 'threshold': 2.805, 'action_code': 2}
+    assert format_driver(driver) == "soil_ec 3.1 > 2.81 pushed toward code 2"
+
+
+def test_controller_row_works_with_model_and_explainer(model):
+    reading = {
+        'soil_moisture': 800, 'temperature': 25.0, 'humidity': 80, 'rain_probability': 0.1,
+        'time_of_day': 12, 'soil_ec': 3.2, 'season': 'Winter',
+    }
+    features = build_feature_row(reading, list(model.feature_names_in_))
+    assert features.loc[0, 'season_Winter'] == 1
+    assert features.loc[0, 'season_Monsoon'] == 0
+
+    result = DecisionExplainer(model).explain(features)
+    assert result['action_code'] == model.predict(features)[0]
+    assert result['drivers']
@@ -15,6 +15,7 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report
 import joblib
 import warnings
+from drift_monitor import build_reference_profile, save_reference_profile, REFERENCE_PROFILE_PATH
 
 warnings.filterwarnings('ignore', category=UserWarning)
 
@@ -84,6 +85,10 @@ def train_from_preprocessed_data():
     # Save the trained model to a file
     joblib.dump(model, MODEL_SAVE_PATH)
     print(f"\n✅ SUCCESS: Model has been saved to '{MODEL_SAVE_PATH}'")
+
+    # Save what the training inputs looked like so the controller can spot drift
+    save_reference_profile(build_reference_profile(X_train), REFERENCE_PROFILE_PATH)
+    print(f"✅ Drift reference profile saved to '{REFERENCE_PROFILE_PATH}'")
     print("--- Training Pipeline Finished ---")
 
 